@@ -19,6 +19,8 @@ using System.Diagnostics;
 using System.Text.Json;
 using System.Reflection;
 using System.ComponentModel;
+using System.Collections.Frozen;
+using System.IO.Enumeration;
 using System.Linq;
 
 namespace WallpaperSlideshow;
@@ -28,6 +30,9 @@ namespace WallpaperSlideshow;
 /// </summary>
 public class Config
 {
+    public const int MinIntervalMinutes = 1;
+    public const int MaxIntervalMinutes = 10080; // One week; keeps the timer interval within int milliseconds
+
     public string WallpaperFolder { get; set; } = @"C:\Windows\Web\Wallpaper";
     public int IntervalMinutes { get; set; } = 15;
     public bool Randomize { get; set; } = true;
@@ -110,6 +115,23 @@ public static class Gfx
         path.CloseFigure();
         return path;
     }
+
+    /// <summary>
+    /// Downscales an image to the smallest size that still covers the target, preserving aspect ratio.
+    /// </summary>
+    public static Bitmap CreateThumbnail(Image source, Size cover)
+    {
+        float ratio = Math.Min(1f, Math.Max(cover.Width / (float)source.Width, cover.Height / (float)source.Height));
+        int w = Math.Max(1, (int)Math.Ceiling(source.Width * ratio));
+        int h = Math.Max(1, (int)Math.Ceiling(source.Height * ratio));
+
+        var bmp = new Bitmap(w, h);
+        using Graphics g = Graphics.FromImage(bmp);
+        g.InterpolationMode = InterpolationMode.HighQualityBicubic;
+        g.PixelOffsetMode = PixelOffsetMode.HighQuality;
+        g.DrawImage(source, new Rectangle(0, 0, w, h), 0, 0, source.Width, source.Height, GraphicsUnit.Pixel);
+        return bmp;
+    }
 }
 
 // --- CUSTOM CONTROLS SECTION ---
@@ -206,8 +228,24 @@ public class ModernNumericUpDown : Panel
     [DesignerSerializationVisibility(DesignerSerializationVisibility.Hidden)]
     public int Value
     {
-        get => int.TryParse(Inner.Text, out int v) ? Math.Max(1, v) : 15;
-        set => Inner.Text = Math.Max(1, value).ToString();
+        get => TryGetValue(out int v) ? v : 15;
+        set => Inner.Text = Math.Clamp(value, Config.MinIntervalMinutes, Config.MaxIntervalMinutes).ToString();
+    }
+
+    /// <summary>
+    /// Parses the entered minutes, clamped to the allowed range. Returns false for empty or non-numeric text.
+    /// </summary>
+    public bool TryGetValue(out int value)
+    {
+        value = 0;
+        string text = Inner.Text.Trim();
+        if (text.Length == 0 || !text.All(char.IsAsciiDigit)) return false;
+
+        // All digits but too long for a long is still just a very large number
+        value = long.TryParse(text, out long v)
+            ? (int)Math.Clamp(v, Config.MinIntervalMinutes, Config.MaxIntervalMinutes)
+            : Config.MaxIntervalMinutes;
+        return true;
     }
 
     public ModernNumericUpDown()
@@ -392,11 +430,36 @@ public class MainForm : Form
     public const int WM_USER = 0x0400;
     public const int WM_NEXT_WALLPAPER = WM_USER + 1;
 
+    private const string ContextMenuKeyPath = @"Software\Classes\DesktopBackground\Shell\WallpaperSlideshowNext";
+    private static readonly FrozenSet<string> ImageExtensions = new[] { ".jpg", ".jpeg", ".png", ".bmp" }.ToFrozenSet(StringComparer.OrdinalIgnoreCase);
+    // Span-keyed view of the set, so extensions can be checked without allocating or lower-casing a string
+    private static readonly FrozenSet<string>.AlternateLookup<ReadOnlySpan<char>> ImageExtensionLookup = ImageExtensions.GetAlternateLookup<ReadOnlySpan<char>>();
+
     private NotifyIcon? _trayIcon;
     private System.Windows.Forms.Timer? _slideTimer;
     private Config _config = new();
     private string _configPath = "";
     private string _appDataFolder = "";
+    private byte[]? _savedConfigJson;
+    private bool _folderAvailable;
+    private List<string> _images = new();
+    private FileSystemWatcher? _folderWatcher;
+    private volatile bool _imagesDirty;
+    private volatile bool _watcherFailed;
+    private static readonly TimeSpan MinFolderProbeDelay = TimeSpan.FromMinutes(1);
+    private static readonly TimeSpan MaxFolderProbeDelay = TimeSpan.FromMinutes(30);
+    private TimeSpan _folderProbeDelay = TimeSpan.Zero;
+    private DateTime _nextFolderProbe = DateTime.MinValue;
+    private readonly Queue<int> _shuffleQueue = new();
+    private readonly object _wallpaperLock = new();
+    private (string Path, string Style)? _pendingWallpaper;
+    private bool _wallpaperWorkerRunning;
+
+    // Small LRU of preview-sized bitmaps, keyed by path and last write time.
+    private const int PreviewCacheSize = 8;
+    private readonly Dictionary<string, Bitmap> _previewCache = new();
+    private readonly LinkedList<string> _previewCacheOrder = new();
+    private int _previewGeneration;
 
     private ModernTextBox? _txtPath;
     private ModernNumericUpDown? _txtInterval;
@@ -420,6 +483,7 @@ public class MainForm : Form
 
         InitPaths();
         LoadConfig();
+        ApplyConfig();
         LoadResources();
 
         // 2. Form Properties
@@ -436,20 +500,18 @@ public class MainForm : Form
         Application.SetHighDpiMode(HighDpiMode.SystemAware);
         UpdateDwmTitleBar();
 
-        InitializeUI();
+        // When launched hidden the settings controls are built on first ShowApp instead
+        if (!startHidden) EnsureUI();
         InitializeTray();
-        UpdateContextMenuButtonState();
 
         // 4. Timer Logic
         _slideTimer = new System.Windows.Forms.Timer();
         UpdateTimer();
         _slideTimer.Tick += OnSlideTimerTick;
 
-        if (Directory.Exists(_config.WallpaperFolder))
-        {
-            _slideTimer.Start();
-            LoadPreview();
-        }
+        // The timer also runs while the folder is missing, so a reconnected drive is picked up again
+        _slideTimer.Start();
+        if (_folderAvailable) LoadPreview();
 
         // 5. System Events for Theme Change
         SystemEvents.UserPreferenceChanged += OnUserPreferenceChanged;
@@ -517,6 +579,7 @@ public class MainForm : Form
 
     private void OnSlideTimerTick(object? sender, EventArgs e)
     {
+        if (!_folderAvailable && DateTime.UtcNow < _nextFolderProbe) return;
         ChangeWallpaper();
     }
 
@@ -548,9 +611,18 @@ public class MainForm : Form
         base.SetVisibleCore(value);
     }
 
+    private void EnsureUI()
+    {
+        if (_headerPanel != null) return;
+        InitializeUI();
+        UpdateContextMenuButtonState();
+    }
+
     private void ShowApp()
     {
         _forceHidden = false; // Release the lock
+        EnsureUI();
+        LoadPreview();
         Show();
         WindowState = FormWindowState.Normal;
         ShowInTaskbar = true;
@@ -650,12 +722,11 @@ public class MainForm : Form
         {
             try
             {
-                string keyPath = @"Software\Classes\DesktopBackground\Shell\WallpaperSlideshowNext";
-                using var key = Registry.CurrentUser.OpenSubKey(keyPath, true);
+                using var key = Registry.CurrentUser.OpenSubKey(ContextMenuKeyPath, true);
 
                 if (key == null)
                 {
-                    using var newKey = Registry.CurrentUser.CreateSubKey(keyPath);
+                    using var newKey = Registry.CurrentUser.CreateSubKey(ContextMenuKeyPath);
                     newKey.SetValue("", "Next Wallpaper");
                     newKey.SetValue("Icon", Application.ExecutablePath);
                     using var cmdKey = newKey.CreateSubKey("command");
@@ -664,7 +735,7 @@ public class MainForm : Form
                 }
                 else
                 {
-                    Registry.CurrentUser.DeleteSubKeyTree(keyPath);
+                    Registry.CurrentUser.DeleteSubKeyTree(ContextMenuKeyPath);
                     MessageBox.Show("Removed from Context Menu!", "Success", MessageBoxButtons.OK, MessageBoxIcon.Information);
                 }
                 UpdateContextMenuButtonState();
@@ -680,8 +751,7 @@ public class MainForm : Form
             if (_btnContext == null) return;
             try
             {
-                string keyPath = @"Software\Classes\DesktopBackground\Shell\WallpaperSlideshowNext";
-                using var key = Registry.CurrentUser.OpenSubKey(keyPath, false);
+                using var key = Registry.CurrentUser.OpenSubKey(ContextMenuKeyPath, false);
                 if (key != null)
                 {
                     _btnContext.Text = "Remove from Ctx";
@@ -699,7 +769,7 @@ public class MainForm : Form
 
         private void SaveAndHide(object? sender, EventArgs e)
         {
-            SaveConfig();
+            if (!SaveConfig()) return;
             Hide();
             _trayIcon?.ShowBalloonTip(2000, "Wallpaper Slideshow", "Running in background.", ToolTipIcon.Info);
         }
@@ -746,39 +816,190 @@ public class MainForm : Form
                 _txtPath.Inner.Text = fbd.SelectedPath;
         }
 
-        private void ChangeWallpaper()
+        private static List<string> GetImageFiles(string folder)
+        {
+            var options = new EnumerationOptions { RecurseSubdirectories = true, IgnoreInaccessible = true, AttributesToSkip = 0 };
+            // Filter on the raw entry name; the full path string is only built for files that match
+            var files = new FileSystemEnumerable<string>(folder, (ref FileSystemEntry entry) => entry.ToFullPath(), options)
+            {
+                ShouldIncludePredicate = (ref FileSystemEntry entry) => !entry.IsDirectory && ImageExtensionLookup.Contains(Path.GetExtension(entry.FileName))
+            };
+            return files.ToList();
+        }
+
+        // Validates the folder once per config change so the timer tick doesn't have to.
+        private void ApplyConfig()
+        {
+            _folderAvailable = Directory.Exists(_config.WallpaperFolder);
+            _folderProbeDelay = TimeSpan.Zero;
+            _nextFolderProbe = DateTime.MinValue;
+            WatchFolder();
+            RefreshImageList();
+            UpdateTimer();
+            _slideTimer?.Start();
+        }
+
+        // Re-validates the folder after a change notification, a failed wallpaper apply, or while it is missing.
+        private void RecheckFolder()
+        {
+            bool wasAvailable = _folderAvailable;
+            _folderAvailable = Directory.Exists(_config.WallpaperFolder);
+            if (_folderAvailable != wasAvailable || _folderWatcher == null || _watcherFailed) WatchFolder();
+            RefreshImageList();
+
+            if (_folderAvailable)
+            {
+                _folderProbeDelay = TimeSpan.Zero;
+            }
+            else
+            {
+                // Probing an offline share can stall the UI thread, so back off in wall-clock time,
+                // capped so a reconnected drive is noticed within half an hour whatever the interval
+                _folderProbeDelay = _folderProbeDelay == TimeSpan.Zero
+                    ? MinFolderProbeDelay
+                    : TimeSpan.FromTicks(Math.Min(_folderProbeDelay.Ticks * 2, MaxFolderProbeDelay.Ticks));
+                _nextFolderProbe = DateTime.UtcNow + _folderProbeDelay;
+            }
+        }
+
+        // Change notifications only mark the list stale; the rescan happens on the next tick,
+        // so a bulk copy into the folder costs one enumeration instead of one per file.
+        private void WatchFolder()
+        {
+            _folderWatcher?.Dispose();
+            _folderWatcher = null;
+            _watcherFailed = false;
+            if (!_folderAvailable) return;
+
+            try
+            {
+                _folderWatcher = new FileSystemWatcher(_config.WallpaperFolder)
+                {
+                    IncludeSubdirectories = true,
+                    NotifyFilter = NotifyFilters.FileName | NotifyFilters.DirectoryName
+                };
+                _folderWatcher.Created += (s, e) => { if (AffectsImageList(e.FullPath, true)) _imagesDirty = true; };
+                _folderWatcher.Deleted += (s, e) => { if (AffectsImageList(e.FullPath, false)) _imagesDirty = true; };
+                _folderWatcher.Renamed += (s, e) =>
+                {
+                    if (AffectsImageList(e.OldFullPath, false) || AffectsImageList(e.FullPath, true)) _imagesDirty = true;
+                };
+                // An error usually means the watcher has stopped (e.g. the share disconnected), so rebuild it
+                _folderWatcher.Error += (s, e) => { _watcherFailed = true; _imagesDirty = true; };
+                _folderWatcher.EnableRaisingEvents = true;
+            }
+            catch { }
+        }
+
+        // Runs on the watcher's thread. Only image files and folders matter, so churn like Thumbs.db,
+        // desktop.ini or editor temp files doesn't trigger a full rescan.
+        private bool AffectsImageList(string path, bool exists)
         {
-            if (!Directory.Exists(_config.WallpaperFolder)) return;
+            if (ImageExtensionLookup.Contains(Path.GetExtension(path.AsSpan()))) return true;
+            if (exists) return Directory.Exists(path);
+
+            // A removed folder only matters if it held images we know about
+            string prefix = path + Path.DirectorySeparatorChar;
+            return _images.Any(p => p.StartsWith(prefix, StringComparison.OrdinalIgnoreCase));
+        }
+
+        private void RefreshImageList()
+        {
+            _imagesDirty = false;
+            List<string> images;
             try
             {
-                var ext = new List<string> { ".jpg", ".jpeg", ".png", ".bmp" };
-                var files = Directory.GetFiles(_config.WallpaperFolder, "*.*", SearchOption.AllDirectories)
-                .Where(f => ext.Contains(Path.GetExtension(f).ToLower()))
-                .ToList();
+                images = _folderAvailable ? GetImageFiles(_config.WallpaperFolder) : new List<string>();
+            }
+            catch { images = new List<string>(); }
 
-                if (files.Count == 0) return;
+            // Queued indices stay valid while the list is unchanged, so the current shuffle round survives a no-op rescan
+            if (!images.SequenceEqual(_images)) _shuffleQueue.Clear();
+            _images = images;
+        }
 
+        private void ChangeWallpaper()
+        {
+            // Without a working watcher, fall back to one rescan (and a watcher retry) per tick
+            if (!_folderAvailable || _imagesDirty || _folderWatcher == null) RecheckFolder();
+            if (_images.Count == 0) return;
+            try
+            {
                 int index;
                 if (_config.Randomize)
-                    index = new Random().Next(files.Count);
+                {
+                    if (_shuffleQueue.Count == 0) RefillShuffleQueue();
+                    index = _shuffleQueue.Dequeue();
+                }
                 else
-                    index = (_config.LastIndex + 1) % files.Count;
+                    index = (_config.LastIndex + 1) % _images.Count;
 
                 _config.LastIndex = index;
 
-                SetWallpaper(files[index]);
-                LoadPreview();
-                SaveConfig();
+                SetWallpaper(_images[index]);
+                if (Visible) LoadPreview();
+                WriteConfig(_config);
                 GC.Collect();
             }
             catch { }
         }
 
-        // Windows API to set wallpaper
-        [DllImport("user32.dll", CharSet = CharSet.Auto)]
+        // Shuffled play order: every wallpaper is shown once before any repeats.
+        private void RefillShuffleQueue()
+        {
+            int[] order = Enumerable.Range(0, _images.Count).ToArray();
+            Random.Shared.Shuffle(order);
+
+            // Don't start the new round with the wallpaper that ended the previous one
+            if (order.Length > 1 && order[0] == _config.LastIndex)
+                (order[0], order[^1]) = (order[^1], order[0]);
+
+            foreach (int i in order) _shuffleQueue.Enqueue(i);
+        }
+
+        // Windows API to set wallpaper (bound directly to the Unicode export, no A/W name probing)
+        private const int SPI_SETDESKWALLPAPER = 0x0014;
+        private const int SPIF_UPDATEINIFILE = 0x01;
+        private const int SPIF_SENDWININICHANGE = 0x02;
+
+        [DllImport("user32.dll", EntryPoint = "SystemParametersInfoW", CharSet = CharSet.Unicode, ExactSpelling = true)]
         static extern int SystemParametersInfo(int uAction, int uParam, string lpvParam, int fuWinIni);
 
+        // The change broadcast blocks until every top-level window answers, so it runs off the UI thread.
+        // Requests only replace the pending wallpaper; a single worker drains it, so the newest one is always applied last.
         private void SetWallpaper(string path)
+        {
+            lock (_wallpaperLock)
+            {
+                _pendingWallpaper = (path, _config.WallpaperStyle.ToLower());
+                if (_wallpaperWorkerRunning) return;
+                _wallpaperWorkerRunning = true;
+            }
+
+            Task.Run(ApplyPendingWallpapers);
+        }
+
+        private void ApplyPendingWallpapers()
+        {
+            while (true)
+            {
+                (string Path, string Style) next;
+                lock (_wallpaperLock)
+                {
+                    if (_pendingWallpaper == null)
+                    {
+                        _wallpaperWorkerRunning = false;
+                        return;
+                    }
+                    next = _pendingWallpaper.Value;
+                    _pendingWallpaper = null;
+                }
+
+                ApplyWallpaper(next.Path, next.Style);
+            }
+        }
+
+        private void ApplyWallpaper(string path, string wallpaperStyle)
         {
             try
             {
@@ -788,7 +1009,7 @@ public class MainForm : Form
                     string style = "10";
                     string tile = "0";
 
-                    switch (_config.WallpaperStyle.ToLower())
+                    switch (wallpaperStyle)
                     {
                         case "fill": style = "10"; tile = "0"; break;
                         case "fit": style = "6"; tile = "0"; break;
@@ -804,34 +1025,92 @@ public class MainForm : Form
             }
             catch { }
 
-            SystemParametersInfo(0x0014, 0, path, 0x01 | 0x02);
+            // A failure usually means the file went away; have the next tick re-validate the folder
+            if (SystemParametersInfo(SPI_SETDESKWALLPAPER, 0, path, SPIF_UPDATEINIFILE | SPIF_SENDWININICHANGE) == 0)
+                _imagesDirty = true;
         }
 
+        // Decoding runs on the thread pool; the cache is only touched on the UI thread.
         private void LoadPreview()
         {
-            try
+            if (_previewBox == null || _config.LastIndex < 0 || _config.LastIndex >= _images.Count) return;
+
+            string path = _images[_config.LastIndex];
+            Size size = _previewBox.Size;
+            int generation = ++_previewGeneration;
+
+            string key;
+            try { key = path + "|" + File.GetLastWriteTimeUtc(path).Ticks; }
+            catch { return; }
+
+            if (_previewCache.TryGetValue(key, out var cached))
             {
-                if (Directory.Exists(_config.WallpaperFolder) && _previewBox != null)
+                _previewCacheOrder.Remove(key);
+                _previewCacheOrder.AddFirst(key);
+                SetCurrentPreview(cached);
+                return;
+            }
+
+            var uiContext = SynchronizationContext.Current;
+            if (uiContext == null) return;
+
+            Task.Run(() =>
+            {
+                Bitmap thumb;
+                try { thumb = DecodePreview(path, size); }
+                catch { return; }
+
+                uiContext.Post(_ =>
                 {
-                    var ext = new List<string> { ".jpg", ".jpeg", ".png", ".bmp" };
-                    var files = Directory.GetFiles(_config.WallpaperFolder, "*.*", SearchOption.AllDirectories)
-                    .Where(f => ext.Contains(Path.GetExtension(f).ToLower()))
-                    .ToList();
+                    if (IsDisposed) { thumb.Dispose(); return; }
 
-                    if (files.Count > 0 && _config.LastIndex < files.Count && _config.LastIndex >= 0)
-                    {
-                        var oldImage = _currentWallpaperImage;
+                    thumb = AddPreviewToCache(key, thumb);
 
-                        using var temp = Image.FromFile(files[_config.LastIndex]);
-                        _currentWallpaperImage = new Bitmap(temp);
+                    // Drop results that were overtaken by a newer wallpaper change
+                    if (generation != _previewGeneration) return;
+                    SetCurrentPreview(thumb);
+                }, null);
+            });
+        }
 
-                        oldImage?.Dispose();
+        // The outgoing image is disposed once the cache no longer owns it (it was evicted while on screen).
+        private void SetCurrentPreview(Bitmap image)
+        {
+            var old = _currentWallpaperImage;
+            _currentWallpaperImage = image;
+            if (old is Bitmap oldBmp && oldBmp != image && !_previewCache.ContainsValue(oldBmp)) oldBmp.Dispose();
+            UpdatePreviewStyle();
+        }
 
-                        UpdatePreviewStyle();
-                    }
-                }
+        // UI thread only. Returns the cached bitmap for the key, which may be one decoded by an earlier request.
+        private Bitmap AddPreviewToCache(string key, Bitmap thumb)
+        {
+            if (_previewCache.TryGetValue(key, out var existing))
+            {
+                thumb.Dispose();
+                return existing;
             }
-            catch { }
+
+            _previewCache[key] = thumb;
+            _previewCacheOrder.AddFirst(key);
+
+            if (_previewCacheOrder.Count > PreviewCacheSize)
+            {
+                string oldest = _previewCacheOrder.Last!.Value;
+                _previewCacheOrder.RemoveLast();
+                if (_previewCache.Remove(oldest, out var evicted) && evicted != _currentWallpaperImage) evicted.Dispose();
+            }
+
+            return thumb;
+        }
+
+        private static Bitmap DecodePreview(string path, Size size)
+        {
+            // Image.FromFile force-validates (fully decodes) the file before we draw it, which decodes it a second time.
+            // Loading unvalidated from a stream leaves a single decode, done straight into the thumbnail.
+            using var stream = new FileStream(path, FileMode.Open, FileAccess.Read, FileShare.ReadWrite | FileShare.Delete);
+            using var temp = Image.FromStream(stream, false, false);
+            return Gfx.CreateThumbnail(temp, size);
         }
 
         private void UpdatePreviewStyle()
@@ -852,14 +1131,25 @@ public class MainForm : Form
             using Graphics g = Graphics.FromImage(bmp);
 
             g.Clear(Color.Black);
-            g.SmoothingMode = SmoothingMode.HighQuality;
-            g.InterpolationMode = InterpolationMode.HighQualityBicubic;
+            // Fit and Center still shrink the cover-sized thumbnail well below 50%, which plain Bilinear would alias;
+            // HighQualityBilinear prefilters and is cheap at this canvas size
+            g.InterpolationMode = InterpolationMode.HighQualityBilinear;
             g.PixelOffsetMode = PixelOffsetMode.HighQuality;
 
             if (original == null) return bmp;
 
-            Rectangle destRect;
             Rectangle srcRect = new Rectangle(0, 0, original.Width, original.Height);
+            float fitRatio = Math.Min(canvasSize.Width / (float)original.Width, canvasSize.Height / (float)original.Height);
+            float fillRatio = Math.Max(canvasSize.Width / (float)original.Width, canvasSize.Height / (float)original.Height);
+
+            // Scales the image by the given ratio and draws it centered on the canvas
+            void DrawCentered(float scale)
+            {
+                int sw = (int)(original.Width * scale);
+                int sh = (int)(original.Height * scale);
+                var dest = new Rectangle((canvasSize.Width - sw) / 2, (canvasSize.Height - sh) / 2, sw, sh);
+                g.DrawImage(original, dest, srcRect.X, srcRect.Y, srcRect.Width, srcRect.Height, GraphicsUnit.Pixel);
+            }
 
             float ratio;
             int w, h;
@@ -868,33 +1158,12 @@ public class MainForm : Form
             {
                 case "stretch":
                 case "span":
-                    destRect = new Rectangle(0, 0, canvasSize.Width, canvasSize.Height);
-                    g.DrawImage(original, destRect, srcRect.X, srcRect.Y, srcRect.Width, srcRect.Height, GraphicsUnit.Pixel);
-                    break;
-
-                case "fit":
-                    ratio = Math.Min(canvasSize.Width / (float)original.Width, canvasSize.Height / (float)original.Height);
-                    w = (int)(original.Width * ratio);
-                    h = (int)(original.Height * ratio);
-                    destRect = new Rectangle((canvasSize.Width - w) / 2, (canvasSize.Height - h) / 2, w, h);
-                    g.DrawImage(original, destRect, srcRect.X, srcRect.Y, srcRect.Width, srcRect.Height, GraphicsUnit.Pixel);
+                    g.DrawImage(original, new Rectangle(0, 0, canvasSize.Width, canvasSize.Height), srcRect.X, srcRect.Y, srcRect.Width, srcRect.Height, GraphicsUnit.Pixel);
                     break;
 
-                case "fill":
-                    ratio = Math.Max(canvasSize.Width / (float)original.Width, canvasSize.Height / (float)original.Height);
-                    w = (int)(original.Width * ratio);
-                    h = (int)(original.Height * ratio);
-                    destRect = new Rectangle((canvasSize.Width - w) / 2, (canvasSize.Height - h) / 2, w, h);
-                    g.DrawImage(original, destRect, srcRect.X, srcRect.Y, srcRect.Width, srcRect.Height, GraphicsUnit.Pixel);
-                    break;
-
-                case "center":
-                    ratio = Math.Min(canvasSize.Width / (float)original.Width, canvasSize.Height / (float)original.Height) * 0.6f;
-                    w = (int)(original.Width * ratio);
-                    h = (int)(original.Height * ratio);
-                    destRect = new Rectangle((canvasSize.Width - w) / 2, (canvasSize.Height - h) / 2, w, h);
-                    g.DrawImage(original, destRect, srcRect.X, srcRect.Y, srcRect.Width, srcRect.Height, GraphicsUnit.Pixel);
-                    break;
+                case "fit": DrawCentered(fitRatio); break;
+                case "fill": DrawCentered(fillRatio); break;
+                case "center": DrawCentered(fitRatio * 0.6f); break;
 
                 case "tile":
                     ratio = (canvasSize.Width * 0.25f) / original.Width;
@@ -907,7 +1176,7 @@ public class MainForm : Form
                     {
                         using (Graphics tg = Graphics.FromImage(tileBmp))
                         {
-                            tg.InterpolationMode = InterpolationMode.HighQualityBicubic;
+                            tg.InterpolationMode = InterpolationMode.HighQualityBilinear;
                             tg.DrawImage(original, new Rectangle(0, 0, w, h), srcRect.X, srcRect.Y, srcRect.Width, srcRect.Height, GraphicsUnit.Pixel);
                         }
                         using (TextureBrush tb = new TextureBrush(tileBmp))
@@ -921,22 +1190,58 @@ public class MainForm : Form
             return bmp;
         }
 
-        private void SaveConfig()
+        // Builds the new settings separately so a failed write leaves the running config untouched.
+        private bool SaveConfig()
         {
-            if (_txtPath != null) _config.WallpaperFolder = _txtPath.Inner.Text;
-            if (_txtInterval != null) _config.IntervalMinutes = _txtInterval.Value;
-            if (_chkRandom != null) _config.Randomize = _chkRandom.Checked;
-            if (_chkStartup != null) _config.RunAtStartup = _chkStartup.Checked;
-            if (_cmbStyle != null) _config.WallpaperStyle = _cmbStyle.SelectedItem?.ToString() ?? "Fill";
+            int interval = _config.IntervalMinutes;
+            if (_txtInterval != null && !_txtInterval.TryGetValue(out interval))
+            {
+                MessageBox.Show("Please enter the interval as a whole number of minutes.", "Invalid Interval", MessageBoxButtons.OK, MessageBoxIcon.Warning);
+                return false;
+            }
+
+            var candidate = new Config
+            {
+                WallpaperFolder = _txtPath?.Inner.Text.Trim() ?? _config.WallpaperFolder,
+                IntervalMinutes = interval,
+                Randomize = _chkRandom?.Checked ?? _config.Randomize,
+                RunAtStartup = _chkStartup?.Checked ?? _config.RunAtStartup,
+                LastIndex = _config.LastIndex,
+                WallpaperStyle = _cmbStyle != null ? _cmbStyle.SelectedItem?.ToString() ?? "Fill" : _config.WallpaperStyle
+            };
+
+            if (!WriteConfig(candidate))
+            {
+                MessageBox.Show("Could not save settings to:\n" + _configPath, "Error", MessageBoxButtons.OK, MessageBoxIcon.Error);
+                return false;
+            }
 
+            _config = candidate;
+            SetStartup(_config.RunAtStartup);
+            ApplyConfig();
+            return true;
+        }
+
+        private bool WriteConfig(Config config)
+        {
             try
             {
-                string json = JsonSerializer.Serialize(_config, new JsonSerializerOptions { WriteIndented = true });
-                File.WriteAllText(_configPath, json);
-                SetStartup(_config.RunAtStartup);
-                UpdateTimer();
+                byte[] json = JsonSerializer.SerializeToUtf8Bytes(config);
+                if (_savedConfigJson == null || !json.AsSpan().SequenceEqual(_savedConfigJson))
+                {
+                    // Write to a temp file and swap it in, so a crash mid-write never leaves a truncated config
+                    string tempPath = _configPath + ".tmp";
+                    using (var fs = new FileStream(tempPath, FileMode.Create, FileAccess.Write, FileShare.None))
+                    {
+                        fs.Write(json);
+                        fs.Flush(true);
+                    }
+                    File.Move(tempPath, _configPath, true);
+                    _savedConfigJson = json;
+                }
+                return true;
             }
-            catch { }
+            catch { return false; }
         }
 
         private void InitializeTray()
@@ -959,8 +1264,18 @@ public class MainForm : Form
         {
             try
             {
-                using var rk = Registry.CurrentUser.OpenSubKey(@"SOFTWARE\Microsoft\Windows\CurrentVersion\Run", true);
-                if (enable) rk?.SetValue("WallpaperSlideshow", $"\"{Application.ExecutablePath}\" --startup");
+                string runKeyPath = @"SOFTWARE\Microsoft\Windows\CurrentVersion\Run";
+                string command = $"\"{Application.ExecutablePath}\" --startup";
+
+                // Leave the Run key untouched when it already matches
+                using (var current = Registry.CurrentUser.OpenSubKey(runKeyPath, false))
+                {
+                    object? value = current?.GetValue("WallpaperSlideshow");
+                    if (enable ? command.Equals(value) : value == null) return;
+                }
+
+                using var rk = Registry.CurrentUser.OpenSubKey(runKeyPath, true);
+                if (enable) rk?.SetValue("WallpaperSlideshow", command);
                 else rk?.DeleteValue("WallpaperSlideshow", false);
             }
             catch { }
@@ -978,12 +1293,16 @@ public class MainForm : Form
             {
                 try
                 {
-                    string content = File.ReadAllText(_configPath);
+                    // Parse the raw UTF-8 bytes directly instead of decoding to a string first
+                    ReadOnlySpan<byte> content = File.ReadAllBytes(_configPath);
+                    if (content.StartsWith("\uFEFF"u8)) content = content[3..];
                     var loaded = JsonSerializer.Deserialize<Config>(content);
                     if (loaded != null)
                     {
                         _config = loaded;
                         _config.WallpaperFolder = _config.WallpaperFolder.Replace("\\\\", "\\");
+                        _config.IntervalMinutes = Math.Clamp(_config.IntervalMinutes, Config.MinIntervalMinutes, Config.MaxIntervalMinutes);
+                        _savedConfigJson = JsonSerializer.SerializeToUtf8Bytes(_config);
                     }
                 }
                 catch { }